@@ -1,3 +1,4 @@
+import logging
 import random
 from enum import Enum
 
@@ -8,6 +9,8 @@ from simpy import Resource
 
 from examples.hospital_staffing.events import EventTopic
 
+logger = logging.getLogger(__name__)
+
 
 class IssueTypes(Enum):
     CHEST_PAIN = "Chest pain"
@@ -15,12 +18,31 @@ class IssueTypes(Enum):
     WANTS_DIRECTIONS = "Wants Directions"
 
 
+ISSUE_VALUES = tuple(IssueTypes)
+
+# Time (in seconds) it takes reception to serve a patient with each issue.
+SERVE_TIMES = {
+    IssueTypes.CHEST_PAIN: 60,
+    IssueTypes.BROKEN_BONE: 300,
+    IssueTypes.WANTS_DIRECTIONS: 10,
+}
+
+
 class Patient(BaseComponent, Loggable):
-    def __init__(self, env: SimLogEnvironment, name: str = None, subscriptions=None, **kwargs):
+    def __init__(
+        self,
+        env: SimLogEnvironment,
+        name: str = None,
+        subscriptions=None,
+        issue: IssueTypes = None,
+        join_queue: bool = True,
+        **kwargs,
+    ):
         super().__init__(env, subscriptions=subscriptions, **kwargs)
-        self.issue = random.choice(list(IssueTypes))
+        self.issue = issue if issue else random.choice(ISSUE_VALUES)
         self.id = name
-        BaseSimLogEvent(env=env, topic=EventTopic.PATIENT_JOINED_QUEUE, parent=None).succeed(self)
+        if join_queue:
+            BaseSimLogEvent(env=env, topic=EventTopic.PATIENT_JOINED_QUEUE, parent=None).succeed(self)
 
     def get_loggable_data(self):
         return {"id": str(self.id), "issue": self.issue.value if self.issue else None}
@@ -36,26 +58,23 @@ class Reception(BaseComponent):
             self.env.process(self.serve_patient(patient=event.value))
         if event.topic == EventTopic.PATIENT_JOINED_QUEUE:
             self.env.process(self.wait_in_line(patient=event.value))
+        if event.topic == EventTopic.PATIENTS_JOINED_QUEUE:
+            for patient in event.value:
+                self.env.process(self.wait_in_line(patient=patient))
 
     def serve_patient(self, patient: Patient):
         """The time it takes to serve a patient depends on their issue."""
         with self.reception.request() as request:
             yield request
-            print(f"{self.env.now}: Patient {patient.id} is being served.")
-            time_taken = 0
-            if patient.issue == IssueTypes.CHEST_PAIN:
-                time_taken = 60
-            if patient.issue == IssueTypes.BROKEN_BONE:
-                time_taken = 300
-            if patient.issue == IssueTypes.WANTS_DIRECTIONS:
-                time_taken = 10
-            print(f"{self.env.now}: Patient {patient.id} is talking to reception.")
+            logger.debug("%s: Patient %s is being served.", self.env.now, patient.id)
+            time_taken = SERVE_TIMES.get(patient.issue, 0)
+            logger.debug("%s: Patient %s is talking to reception.", self.env.now, patient.id)
             yield self.env.timeout(delay=time_taken)
-            print(f"{self.env.now}: Patient {patient.id} has left reception.")
+            logger.debug("%s: Patient %s has left reception.", self.env.now, patient.id)
 
     def wait_in_line(self, patient: Patient):
         """Check if the resource is available."""
         with self.reception.request() as request:
             yield request  # Wait until the reception resource becomes available
-            print(f"At time {self.env.now}, Patient {patient.id} joined the queue.")
+            logger.debug("At time %s, Patient %s joined the queue.", self.env.now, patient.id)
             return BaseSimLogEvent(env=self.env, topic=EventTopic.PATIENT_ARRIVED_AT_DESK, parent=None).succeed(patient)
@@ -1,12 +1,13 @@
-from enum import Enum
+from simlog.events.events import EventTopicEnum, EventTopicValue
 
-from simlog.events.events import EventTopicValue
 
-
-class EventTopic(Enum):
+class EventTopic(EventTopicEnum):
     """List of possible events."""
 
     PATIENT_JOINED_QUEUE = EventTopicValue(value="PATIENT_JOINED_QUEUE", description="Patient joined the queue")
+    PATIENTS_JOINED_QUEUE = EventTopicValue(
+        value="PATIENTS_JOINED_QUEUE", description="A batch of patients joined the queue"
+    )
     PATIENT_ARRIVED_AT_DESK = EventTopicValue(
         value="PATIENT_ARRIVED_AT_DESK", description="Patient being served by reception staff"
     )
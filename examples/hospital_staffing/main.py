@@ -1,18 +1,28 @@
+import logging
+import random
 from os import mkdir
 from pathlib import Path
 
 from simlog.data_models.event_log import EventLog
 from simlog.engine.component_manager import ComponentManager
 from simlog.engine.environment import SimLogEnvironment
+from simlog.events.events import BaseSimLogEvent
 
-from examples.hospital_staffing.components import Patient, Reception
+from examples.hospital_staffing.components import ISSUE_VALUES, Patient, Reception
 from examples.hospital_staffing.events import EventTopic
 
 NUM_RECEPTIONISTS = 2
+NUM_PATIENTS = 10
 
+logger = logging.getLogger(__name__)
 
-def generate_patients(env: SimLogEnvironment):
-    return [Patient(env=env, name=entry) for entry in range(10)]
+
+def generate_patients(env: SimLogEnvironment, num_patients: int = NUM_PATIENTS):
+    """Create the patients, announcing them to reception with a single batch event."""
+    issues = random.choices(ISSUE_VALUES, k=num_patients)
+    patients = [Patient(env=env, name=entry, issue=issue, join_queue=False) for entry, issue in enumerate(issues)]
+    BaseSimLogEvent(env=env, topic=EventTopic.PATIENTS_JOINED_QUEUE, parent=None).succeed(patients)
+    return patients
 
 
 def main():
@@ -22,16 +32,25 @@ def main():
         mkdir("output")
 
     env = SimLogEnvironment()
-    reception = Reception(env=env, subscriptions=[EventTopic.PATIENT_JOINED_QUEUE, EventTopic.PATIENT_ARRIVED_AT_DESK])
+    reception = Reception(
+        env=env,
+        subscriptions=[
+            EventTopic.PATIENT_JOINED_QUEUE,
+            EventTopic.PATIENTS_JOINED_QUEUE,
+            EventTopic.PATIENT_ARRIVED_AT_DESK,
+        ],
+    )
     patients = generate_patients(env=env)
     manager = ComponentManager(env=env, components=[reception] + patients)
     env.manager = manager
     env.run(until=60*60)
 
-    print("Simulation run complete.")
+    logger.info("Simulation run complete.")
     event_log = EventLog(logs=env.manager.event_log)
     event_log.json_dump(path=Path("output/event_log.json"), event_topic=EventTopic)
 
 
 if __name__ == "__main__":
+    # Per-patient progress is logged at DEBUG level, set the level to DEBUG to see it.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
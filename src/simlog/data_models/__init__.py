@@ -1,3 +1,3 @@
-from simlog.data_models.event_log import LoggedEvent
+from simlog.data_models.event_log import EventLogBuffer, LoggedEvent, RawLogEntry
 
-__all__ = ["LoggedEvent"]
+__all__ = ["EventLogBuffer", "LoggedEvent", "RawLogEntry"]
@@ -1,9 +1,25 @@
+import functools
 import json
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, time
 from enum import Enum
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from simlog.events.events import EventTopicEnum
+
+try:
+    import orjson
+except ImportError:  # orjson is not available on PyPy, fall back to the standard library.
+    orjson = None
+
+# Message of the orjson.JSONEncodeError raised for integers outside the 64-bit range.
+_ORJSON_INTEGER_OVERFLOW = "Integer exceeds 64-bit range"
 
 
 class LoggedEvent(BaseModel):
@@ -21,26 +37,275 @@ class LoggedEvent(BaseModel):
     component_state: str | None = Field(None, description="Component state")
 
 
+def _shallow_fields(obj: Any) -> dict[str, Any]:
+    """Map the fields of a dataclass instance to their values."""
+    # Not dataclasses.asdict - that would deep copy the field values.
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
+@dataclass(slots=True)
+class RawLogEntry:
+    """
+    Unvalidated event log entry.
+
+    Mirrors the fields of :class:`LoggedEvent`. Validation is deferred until
+    the log is serialised.
+    """
+
+    topic: str
+    parent: str | None
+    single_reference: str | None
+    sim_time: float
+    value: Any
+    simpy_id: int
+    simpy_priority: int
+    component_state: str | None
+
+    def to_logged_event(self) -> LoggedEvent:
+        """Validate the entry, returning the equivalent :class:`LoggedEvent`."""
+        return LoggedEvent(**_shallow_fields(self))
+
+
+class EventLogBuffer:
+    """
+    Columnar store of the events logged during a simulation.
+
+    Holds one column per :class:`LoggedEvent` field rather than one object per event.
+    Numeric fields are stored unboxed in arrays. Iterating yields :class:`RawLogEntry` rows.
+    """
+
+    __slots__ = (
+        "topics",
+        "parents",
+        "single_references",
+        "sim_times",
+        "values",
+        "simpy_ids",
+        "simpy_priorities",
+        "component_states",
+    )
+
+    def __init__(self) -> None:
+        self.topics: list[str] = []
+        self.parents: list[str | None] = []
+        self.single_references: list[str | None] = []
+        self.sim_times = array("d")
+        self.values: list[Any] = []
+        self.simpy_ids = array("q")
+        self.simpy_priorities = array("q")
+        self.component_states: list[str | None] = []
+
+    def append(
+        self,
+        topic: str,
+        parent: str | None,
+        single_reference: str | None,
+        sim_time: float,
+        value: Any,
+        simpy_id: int,
+        simpy_priority: int,
+        component_state: str | None,
+    ) -> None:
+        """
+        Add an event to the end of the log.
+
+        The row is added to every column or to none: if a numeric field does not fit its
+        array, the columns already extended are rolled back before the error is raised.
+        """
+        # The typed arrays are the only columns that can reject a value, so fill them first.
+        self.sim_times.append(sim_time)
+        try:
+            self.simpy_ids.append(simpy_id)
+        except BaseException:
+            self.sim_times.pop()
+            raise
+        try:
+            self.simpy_priorities.append(simpy_priority)
+        except BaseException:
+            self.sim_times.pop()
+            self.simpy_ids.pop()
+            raise
+        self.topics.append(topic)
+        self.parents.append(parent)
+        self.single_references.append(single_reference)
+        self.values.append(value)
+        self.component_states.append(component_state)
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def __getitem__(self, index: int | slice) -> RawLogEntry | list[RawLogEntry]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return RawLogEntry(
+            self.topics[index],
+            self.parents[index],
+            self.single_references[index],
+            self.sim_times[index],
+            self.values[index],
+            self.simpy_ids[index],
+            self.simpy_priorities[index],
+            self.component_states[index],
+        )
+
+    def __iter__(self) -> Iterator[RawLogEntry]:
+        for row in zip(
+            self.topics,
+            self.parents,
+            self.single_references,
+            self.sim_times,
+            self.values,
+            self.simpy_ids,
+            self.simpy_priorities,
+            self.component_states,
+        ):
+            yield RawLogEntry(*row)
+
+
 class Loggable:
     def get_loggable_data(self):
         """Return a dictionary of data that should be logged."""
         raise NotImplementedError
 
 
+def _serialize_default(obj: Any) -> Any:
+    """
+    Serialise values the JSON encoder does not support natively.
+
+    Covers the types orjson serialises natively too, so that the standard library
+    fallback (see :func:`_to_json_compatible`) writes the same values. This relies on
+    :func:`_resolve_loggables` having already replaced every :class:`Loggable` in the
+    logged value, as orjson never calls this hook for the types it writes itself.
+
+    Two differences remain: orjson writes non-finite floats as null, where the json
+    module writes Infinity and NaN, and formats some float exponents differently
+    (``1e-7`` rather than ``1e-07``), although both parse to the same number.
+    """
+    if isinstance(obj, Loggable):
+        return obj.get_loggable_data()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (date, time)):
+        # Also covers datetime, which subclasses date.
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _shallow_fields(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _resolve_loggables(obj: Any) -> Any:
+    """
+    Recursively replace the :class:`Loggable` values nested in a value with their loggable data.
+
+    orjson only calls its ``default`` hook for types it cannot write itself, so a
+    :class:`Loggable` that is also a dataclass, enum, UUID or date would otherwise be
+    written natively, without calling ``get_loggable_data``.
+    """
+    if isinstance(obj, Loggable):
+        return _resolve_loggables(obj.get_loggable_data())
+    if isinstance(obj, dict):
+        return {key: _resolve_loggables(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_resolve_loggables(item) for item in obj]
+    if isinstance(obj, BaseModel):
+        return _resolve_loggables(obj.model_dump())
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _resolve_loggables(_shallow_fields(obj))
+    return obj
+
+
+def _json_key(key: Any) -> Any:
+    """Convert a dict key to one the json module accepts, as orjson does with OPT_NON_STR_KEYS."""
+    if key is None or isinstance(key, (str, int, float)):
+        return key
+    return _json_key(_serialize_default(key))
+
+
+def _to_json_compatible(obj: Any) -> Any:
+    """
+    Recursively convert a value to the types the json module writes natively.
+
+    The json module only calls its ``default`` hook for values, never for dict keys,
+    so keys and values are both converted up front instead.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, dict):
+        return {_json_key(key): _to_json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_compatible(item) for item in obj]
+    return _to_json_compatible(_serialize_default(obj))
+
+
+def _describe_topics(event_topic: Iterable[Enum]) -> dict[str, str]:
+    """Map each event topic to its description."""
+    descriptions = {}
+    for member in event_topic:
+        if isinstance(member, EventTopicEnum):
+            descriptions[member.value_str] = member.description
+        else:
+            descriptions[member.value.value] = member.value.description
+    return descriptions
+
+
+@functools.cache
+def _descriptions_for(event_topic: type[Enum]) -> dict[str, str]:
+    """Map each topic of an event topic enum to its description, cached as enums are immutable."""
+    return _describe_topics(event_topic)
+
+
 class EventLog(BaseModel):
-    logs: list[LoggedEvent]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    logs: EventLogBuffer | list[RawLogEntry | LoggedEvent]
+
+    @field_serializer("logs")
+    def serialize_logs(self, logs: EventLogBuffer | list[RawLogEntry | LoggedEvent]) -> list[LoggedEvent]:
+        """Serialise the logs as validated :class:`LoggedEvent` rows, whichever way they are stored."""
+        return [log.to_logged_event() if isinstance(log, RawLogEntry) else log for log in logs]
+
+    def json_dump(self, path: Path | str, event_topic: type[Enum] | Iterable[Enum]):
+        """
+        Write the event log, with the descriptions of the event topics, to a JSON file.
 
-    def json_dump(self, path: Path, event_topic: Enum):
-        event_descriptions = {member.value.value: member.value.description for member in event_topic}
+        Args:
+            path (:obj:`Path` or :obj:`str`): File to write.
+            event_topic (:obj:`type` of :obj:`Enum` or :obj:`Iterable` of :obj:`Enum`): The event topic
+                enum, or the topics to describe.
+        """
+        if isinstance(event_topic, type):
+            event_descriptions = _descriptions_for(event_topic)
+        else:
+            event_descriptions = _describe_topics(event_topic)
         dump_dict = {
             "event_descriptions": event_descriptions,
             "logs": [self.convert_log_to_dict(log) for log in self.logs],
         }
+        if orjson is not None:
+            # Non-str keys are converted to strings, as the json module does.
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            try:
+                data = orjson.dumps(dump_dict, default=_serialize_default, option=options)
+            except orjson.JSONEncodeError as exc:
+                # orjson rejects integers beyond 64 bits, which the json module can write. The retry
+                # serialises the log again, so get_loggable_data must be free of side effects.
+                if str(exc) != _ORJSON_INTEGER_OVERFLOW:
+                    raise
+            else:
+                Path(path).write_bytes(data)
+                return
+        json_dict = _to_json_compatible(dump_dict)
         with open(path, "w") as f:
-            json.dump(dump_dict, f, indent=4)
+            json.dump(json_dict, f, indent=2)
 
     def convert_log_to_dict(self, log):
-        log_dict = log.dict()
-        if isinstance(log.value, Loggable):
-            log_dict["value"] = log.value.get_loggable_data()
+        if isinstance(log, RawLogEntry):
+            log = log.to_logged_event()
+        # A shallow copy of the validated fields, other nested values are handled by _serialize_default.
+        log_dict = dict(log.__dict__)
+        log_dict["value"] = _resolve_loggables(log.value)
         return log_dict
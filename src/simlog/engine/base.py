@@ -1,4 +1,4 @@
-import uuid
+import itertools
 from abc import abstractmethod
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
@@ -22,6 +22,24 @@ if TYPE_CHECKING:
 SUPPORTED_EVENTS = [BaseSimLogEvent, SimLogProcess, SimLogTargetedTimeout, SimLogTimeout, SimLogUuidRefEvent]
 
 
+class ComponentId(int):
+    """
+    Process-local component identifier.
+
+    Cheaper to create and hash than a UUID. Subclasses int so that component
+    references can still be told apart from plain integer event values.
+    """
+
+    __slots__ = ()
+
+
+# Types that reference a component by its identifier.
+COMPONENT_ID_TYPES = (UUID, ComponentId)
+
+# Starts at 1 so that every identifier is truthy.
+_component_ids = itertools.count(1)
+
+
 class BaseComponent:
     """
     Base class all Components inherit from.
@@ -30,10 +48,13 @@ class BaseComponent:
     for creating and listening for simulation events.
     """
 
+    # Simulation time of the last state change, None until the state is first updated.
+    last_time_state_updated: float | None = None
+
     def __init__(
         self,
         env: "SimLogEnvironment",
-        unique_id: UUID | None = None,
+        unique_id: UUID | ComponentId | None = None,
         subscriptions: Sequence[EventTopic] | None = None,
         name: str | None = None,
     ) -> None:
@@ -41,7 +62,7 @@ class BaseComponent:
         Constructor for the BaseComponent
         Args:
             env (SimLogEnvironment): Simulation environment, responsible for the core sim loop.
-            unique_id (UUID, optional): Identifier for the component.
+            unique_id (UUID | ComponentId, optional): Identifier for the component. Defaults to a new ComponentId.
             subscriptions (:obj:`list` of :obj:`EventTopic`, optional): Topics the component subscribes to.
             name (str, optional): Component name.
         """
@@ -49,9 +70,8 @@ class BaseComponent:
         self._subscriptions = subscriptions
         if subscriptions is None:
             self._subscriptions = []
-        self.uuid = unique_id if unique_id else uuid.uuid4()
+        self.uuid = unique_id if unique_id else ComponentId(next(_component_ids))
         self.name = name if name else self.__class__.__name__
-        self.last_time_state_updated = self.env.now
         self.state: str | None = None
 
     @abstractmethod
@@ -69,7 +89,7 @@ class BaseComponent:
         """Set component subscriptions."""
         self._subscriptions = subscriptions
 
-    def update_state(self, new_state: str, location: UUID | str | None = None):
+    def update_state(self, new_state: str, location: UUID | ComponentId | str | None = None):
         """This function updates the state of a component.
 
         It then publishes a corresponding event for the state update.
@@ -80,37 +100,36 @@ class BaseComponent:
          ----------
         new_state : any
             The new state name.
-        location : Union[UUID, str], default None
+        location : Union[UUID, ComponentId, str], default None
             Reference to a component that is the location of the state change.
         """
-        if isinstance(location, UUID):
-            location = self.env.manager.get_component_name_by_uuid(location)
-        else:
-            location = location
-        if new_state is self.state:
+        if new_state == self.state:
             # do nothing - no change in state
-            pass
+            return
 
-        else:
-            # update state and log event
-            self.state = new_state
+        if isinstance(location, COMPONENT_ID_TYPES):
+            location = self.env.manager.get_component_name_by_uuid(location)
 
-            event_topic = EventTopic.STATE_CHANGE
+        # update state and log event
+        self.state = new_state
+        self.last_time_state_updated = self.env.now
 
-            event = BaseSimLogEvent(
-                env=self.env,
-                topic=event_topic,
-                parent=self.uuid,
-            )
-            event.component_state = self.state
-            event.succeed(value=location)
+        event_topic = EventTopic.STATE_CHANGE
+
+        event = BaseSimLogEvent(
+            env=self.env,
+            topic=event_topic,
+            parent=self.uuid,
+        )
+        event.component_state = self.state
+        event.succeed(value=location)
 
     def start_process(
         self,
         generator: ProcessGenerator,
         start_topic: EventTopic,
         end_topic: EventTopic,
-        target: UUID | None = None,
+        target: UUID | ComponentId | None = None,
     ):
         """Process an event yielding generator with SimLog event attributes
 
@@ -119,7 +138,7 @@ class BaseComponent:
             start_topic: EventTopic - the topic of the event that initialises the process
             end_topic: EventTopic - the topic of the Process event - i.e. the event processed
                 when the process is complete
-            target: UUID of component to be notified when the process is finished
+            target: identifier of component to be notified when the process is finished
         """
         return SimLogProcess(
             env=self.env,
@@ -133,7 +152,7 @@ class BaseComponent:
     def create_event(
         self,
         topic: EventTopic,
-        target: UUID | None = None,
+        target: UUID | ComponentId | None = None,
         cause: Event | None = None,
         value: Any | None = None,
         timeout: int | None = None,
@@ -142,7 +161,7 @@ class BaseComponent:
 
         Arguments:
         topic: EventTopic - event topic of the event
-        target: UUID of component to be notified when the event is processed
+        target: identifier of component to be notified when the event is processed
         cause: Event - an event to be passed at the event cause
         value: Any - value of the event, passed to succeed method
         delay: Numeric - number of simulation seconds to wait until the event is processed
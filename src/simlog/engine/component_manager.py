@@ -1,15 +1,18 @@
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from simpy import Event, Interrupt
 from simpy.events import EventCallbacks, Initialize, Timeout
 
-from simlog.data_models import LoggedEvent
+from simlog.data_models import EventLogBuffer
+from simlog.data_models.event_log import Loggable
+from simlog.engine.base import COMPONENT_ID_TYPES, BaseComponent, ComponentId
 from simlog.events.events import (
     BaseSimLogEvent,
     EventTopic,
+    EventTopicEnum,
     SimLogInitialize,
     SimLogProcess,
     SimLogSingleRefEvent,
@@ -17,7 +20,6 @@ from simlog.events.events import (
     SimLogTimeout,
     SimLogUuidRefEvent,
 )
-from src.simlog.engine.base import BaseComponent
 
 if TYPE_CHECKING:
     from simlog.engine import SimLogEnvironment
@@ -40,27 +42,61 @@ class ComponentManager:
         self.env = env
         self._components = None
         self.components = components
-        self.event_log: list = []
+        self.event_log = EventLogBuffer()
+        # A lookup from event type to the trigger_event handler for that type.
+        # Types not listed here are resolved via their MRO on first sight and cached.
+        self._dispatch: dict[type, Callable[[Event], None] | None] = {
+            SimLogProcess: self._handle_process,
+            SimLogTargetedTimeout: self._handle_targeted,
+            SimLogUuidRefEvent: self._handle_targeted,
+            SimLogSingleRefEvent: self._handle_single_ref,
+            SimLogTimeout: self._handle_topic,
+            SimLogInitialize: self._handle_topic,
+            BaseSimLogEvent: self._handle_topic,
+        }
+        # A lookup from event type to whether events of that type are logged, filled on first sight.
+        self._logged_types: dict[type, bool] = {}
 
     def trigger_event(self, event: Event):
         """Method to be patched into env.step."""
         if not self.components:
             return
-        if isinstance(event, SimLogProcess):
-            if hasattr(event, "single_reference"):
-                event.callbacks.append(self._component_lookup[event.single_reference].listen)
-            else:
-                topic = getattr(event, "topic", None)
-                if topic is not None:
-                    event.callbacks += self._subscriptions_lookup[topic]
-        elif isinstance(event, (SimLogTargetedTimeout | SimLogUuidRefEvent)):
-            event.callbacks.append(self._component_lookup[event.single_reference].listen)
-        elif isinstance(event, (SimLogSingleRefEvent)):
-            event.callbacks.append(event.single_reference.listen)
-        elif isinstance(event, (SimLogTimeout | SimLogInitialize | BaseSimLogEvent)):
-            topic = getattr(event, "topic", None)
-            if topic is not None:
-                event.callbacks += self._subscriptions_lookup[topic]
+        event_type = type(event)
+        try:
+            handler = self._dispatch[event_type]
+        except KeyError:
+            handler = self._dispatch[event_type] = self._resolve_handler(event_type)
+        if handler is not None:
+            handler(event)
+
+    def _resolve_handler(self, event_type: type) -> Callable[[Event], None] | None:
+        """Find the handler for an event type not registered in the dispatch table (e.g. a user subclass)."""
+        for base in event_type.__mro__:
+            handler = self._dispatch.get(base)
+            if handler is not None:
+                return handler
+        return None
+
+    def _handle_process(self, event: SimLogProcess):
+        """Notify the process target if it has one, otherwise the subscribers to its topic."""
+        if event.single_reference is not None:
+            self._handle_targeted(event)
+        else:
+            self._handle_topic(event)
+
+    def _handle_targeted(self, event: SimLogTargetedTimeout | SimLogUuidRefEvent | SimLogProcess):
+        """Notify the component referenced by its identifier."""
+        event.callbacks.append(self._component_lookup[event.single_reference].listen)
+
+    def _handle_single_ref(self, event: SimLogSingleRefEvent):
+        """Notify the component referenced directly."""
+        event.callbacks.append(event.single_reference.listen)
+
+    def _handle_topic(self, event: BaseSimLogEvent | SimLogProcess):
+        """Notify the components subscribed to the event topic."""
+        listeners = self._subscriptions_lookup.get(event.topic)
+        if listeners is not None:
+            event.callbacks.extend(listeners)
 
     def log_event(self, event: Event):
         """
@@ -76,12 +112,18 @@ class ComponentManager:
         single_reference = None
         component_state = None
 
-        _event = event[3]
-        if isinstance(_event, (Initialize | Timeout)):
-            return
-        if isinstance(_event, (BaseSimLogEvent | SimLogSingleRefEvent | SimLogProcess | SimLogInitialize)):
-            topic = _event.topic.value if _event.topic else None
-            if isinstance(_event.parent, UUID) and _event.parent:
+        sim_time, simpy_priority, simpy_id, _event = event
+        event_type = type(_event)
+        try:
+            logged = self._logged_types[event_type]
+        except KeyError:
+            logged = self._logged_types[event_type] = self._is_logged_type(event_type)
+        if logged:
+            if isinstance(_event.topic, EventTopicEnum):
+                topic = _event.topic.value_str
+            elif _event.topic:
+                topic = _event.topic.value.value
+            if isinstance(_event.parent, COMPONENT_ID_TYPES) and _event.parent:
                 parent = self.get_component_name_by_uuid(_event.parent)
             elif _event.parent and isinstance(_event.parent, str):
                 parent = _event.parent
@@ -89,22 +131,25 @@ class ComponentManager:
                 parent = _event.parent.name
             else:
                 parent = None
-            if hasattr(_event, "component_state") and _event.component_state:
+            if isinstance(_event.component_state, str):
+                component_state = _event.component_state
+            elif _event.component_state:
                 component_state = _event.component_state.value
 
         if topic is None:
             return
 
-        if isinstance(_event, (SimLogSingleRefEvent)) and isinstance(_event.single_reference, UUID):
+        if isinstance(_event, (SimLogSingleRefEvent)) and isinstance(_event.single_reference, COMPONENT_ID_TYPES):
             single_reference = self.get_component_name_by_uuid(_event.single_reference)
         elif isinstance(_event, (SimLogSingleRefEvent)):
             single_reference = _event.single_reference.name if _event.single_reference else None
-        elif isinstance(_event, (SimLogUuidRefEvent)) and isinstance(_event.single_reference, UUID):
+        elif isinstance(_event, (SimLogUuidRefEvent)) and isinstance(_event.single_reference, COMPONENT_ID_TYPES):
             single_reference = self.get_component_name_by_uuid(_event.single_reference)
 
-        if isinstance(_event.value, BaseComponent):
+        if isinstance(_event.value, BaseComponent) and not isinstance(_event.value, Loggable):
+            # Loggable components are serialised via get_loggable_data when the log is dumped.
             value = _event.value.name
-        elif isinstance(_event.value, UUID):
+        elif isinstance(_event.value, COMPONENT_ID_TYPES):
             value = self.get_component_name_by_uuid(_event.value)
         elif isinstance(_event.value, Interrupt):
             value = {"interruption cause": _event.value.cause}
@@ -112,18 +157,23 @@ class ComponentManager:
             value = _event.value
 
         self.event_log.append(
-            LoggedEvent(
-                topic=topic.value,
-                parent=parent,
-                single_reference=single_reference,
-                sim_time=event[0],
-                value=value,
-                simpy_id=event[2],
-                simpy_priority=event[1],
-                component_state=component_state,
-            )
+            topic=topic,
+            parent=parent,
+            single_reference=single_reference,
+            sim_time=sim_time,
+            value=value,
+            simpy_id=simpy_id,
+            simpy_priority=simpy_priority,
+            component_state=component_state,
         )
 
+    @staticmethod
+    def _is_logged_type(event_type: type) -> bool:
+        """Whether events of this type carry SimLog attributes and should be logged."""
+        if issubclass(event_type, (Initialize | Timeout)):
+            return False
+        return issubclass(event_type, (BaseSimLogEvent | SimLogSingleRefEvent | SimLogProcess | SimLogInitialize))
+
     @property
     def components(self) -> Sequence[BaseComponent] | None:
         """Components property getter."""
@@ -136,26 +186,31 @@ class ComponentManager:
 
         if components is not None:
             # A lookup from component uuid to component.
-            self._component_lookup: dict[UUID, BaseComponent] = {}
+            self._component_lookup: dict[UUID | ComponentId, BaseComponent] = {}
             # A lookup from event topic to component listen functions for components that are subscribed to that event type.
-            self._subscriptions_lookup: dict[EventTopic, EventCallbacks] = defaultdict(list)
+            subscriptions_lookup: dict[EventTopic, EventCallbacks] = defaultdict(list)
 
             for component in components:
-                # Add the lookup from UUID to component
+                # Add the lookup from identifier to component
                 self._component_lookup[component.uuid] = component
 
                 # Add the lookup from event topic to component listen function
                 for topic in component.subscriptions:
-                    self._subscriptions_lookup[topic].append(component.listen)
+                    subscriptions_lookup[topic].append(component.listen)
+
+            # Frozen, as the listeners are only ever read when triggering events.
+            self._subscriptions_lookup: dict[EventTopic, tuple[Callable[[Event], None], ...]] = {
+                topic: tuple(listeners) for topic, listeners in subscriptions_lookup.items()
+            }
         else:
             self._component_lookup = {}
-            self._subscriptions_lookup = defaultdict(list)
+            self._subscriptions_lookup = {}
 
-    def get_component_by_uuid(self, id: UUID) -> BaseComponent | None:
-        """Fetch component object by its UUID."""
+    def get_component_by_uuid(self, id: UUID | ComponentId) -> BaseComponent | None:
+        """Fetch component object by its identifier."""
         return self._component_lookup.get(id)
 
-    def get_component_name_by_uuid(self, id: UUID) -> str | None:
-        """Fetch component name by its UUID."""
+    def get_component_name_by_uuid(self, id: UUID | ComponentId) -> str | None:
+        """Fetch component name by its identifier."""
         component = self._component_lookup.get(id)
         return component.name if component else None
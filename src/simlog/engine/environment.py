@@ -44,6 +44,12 @@ class SimLogEnvironment(Environment):
         self.manager = manager
         self.event_logging = event_logging
 
+    @staticmethod
+    def collect_garbage() -> None:
+        """Run a full garbage collection, reclaiming previous simulation runs.
+
+        Call this between runs when running many simulations in one process.
+        """
         # Why do we need additional garbage collector when we have reference counting?
         # Unfortunately, classical reference counting has a fundamental problem — it cannot
         # detect reference cycles. A reference cycle occurs when one or more objects are
@@ -60,13 +66,15 @@ class SimLogEnvironment(Environment):
         """
 
         # This is the updated part of the step method.
-        if self.manager is None:
+        manager = self.manager
+        if manager is None:
             raise UnsetManager("Set the manager attribute")
-        if len(self._queue):
-            t, prio, eid, event = self._queue[0]
-            self.manager.trigger_event(event=event)
+        if self._queue:
+            # Peek at the next event once, only the logger needs the full queue entry.
+            head = self._queue[0]
+            manager.trigger_event(head[3])
             if self.event_logging:
-                self.manager.log_event(self._queue[0])
+                manager.log_event(head)
         # This is the end of the updated code.
         try:
             self._now, _, _, event = heappop(self._queue)
@@ -1,3 +1,3 @@
-from simlog.events.events import EventTopic, SimLogTimeout
+from simlog.events.events import EventTopic, EventTopicEnum, SimLogTimeout
 
-__all__ = ["EventTopic", "SimLogTimeout"]
+__all__ = ["EventTopic", "EventTopicEnum", "SimLogTimeout"]
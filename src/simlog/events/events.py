@@ -9,6 +9,7 @@ from simpy.events import NORMAL, URGENT, Event, EventCallbacks, Process
 
 if typing.TYPE_CHECKING:
     from simlog.engine import BaseComponent, SimLogEnvironment
+    from simlog.engine.base import ComponentId
 
 
 class EventTopicValue(BaseModel):
@@ -16,7 +17,21 @@ class EventTopicValue(BaseModel):
     description: str
 
 
-class EventTopic(Enum):
+class EventTopicEnum(Enum):
+    """
+    Base class for event topic enums.
+
+    Members must have an :class:`EventTopicValue` as their value. The topic string and
+    description are copied onto each member at class creation, so that logging an event
+    does not go through the pydantic model.
+    """
+
+    def __init__(self, topic_value: EventTopicValue) -> None:
+        self.value_str = topic_value.value
+        self.description = topic_value.description
+
+
+class EventTopic(EventTopicEnum):
     """List of possible events."""
 
     # TODO: Provide interface to define these
@@ -27,12 +42,16 @@ class EventTopic(Enum):
 class BaseSimLogEvent(Event):
     """Base SimLog event which modifies the Simpy Event for the observer pattern."""
 
+    # Simpy's Event has no __slots__, so instances keep a __dict__ for its attributes,
+    # but the SimLog attributes are stored in slots.
+    __slots__ = ("topic", "parent", "component_state", "cause")
+
     def __init__(
         self,
         *,
         env: "SimLogEnvironment",
         topic: EventTopic | None,
-        parent: Union["BaseComponent", UUID, None] = None,
+        parent: Union["BaseComponent", UUID, "ComponentId", None] = None,
         cause: Event | None = None,
     ) -> None:
         """Constructor for the BaseSimLogEvent class."""
@@ -46,12 +65,14 @@ class BaseSimLogEvent(Event):
 class SimLogTimeout(BaseSimLogEvent):
     """A SimLogEvent that gets triggered after a *delay* has passed."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         env: "SimLogEnvironment",
         delay: int,
         topic: EventTopic | None,
-        parent: UUID | None,
+        parent: Union[UUID, "ComponentId", None],
         value: Any | None = None,
         cause: Event | None = None,
     ):
@@ -67,13 +88,15 @@ class SimLogTimeout(BaseSimLogEvent):
 class SimLogTargetedTimeout(SimLogTimeout):
     """A SimLogEvent that gets triggered after a *delay* has passed, notifying a particular component."""
 
+    __slots__ = ("single_reference",)
+
     def __init__(
         self,
         env: "SimLogEnvironment",
         delay: int,
         topic: EventTopic | None,
-        parent: UUID | None,
-        single_reference: UUID | None = None,
+        parent: Union[UUID, "ComponentId", None],
+        single_reference: Union[UUID, "ComponentId", None] = None,
         value: Any | None = None,
         cause: Event | None = None,
     ):
@@ -85,6 +108,8 @@ class SimLogTargetedTimeout(SimLogTimeout):
 class SimLogSingleRefEvent(BaseSimLogEvent):
     """Event which targets a specific component."""
 
+    __slots__ = ("single_reference",)
+
     def __init__(
         self,
         *,
@@ -101,14 +126,16 @@ class SimLogSingleRefEvent(BaseSimLogEvent):
 
 
 class SimLogUuidRefEvent(BaseSimLogEvent):
-    """Event that targets a specific component via UUID."""
+    """Event that targets a specific component via its identifier."""
+
+    __slots__ = ("single_reference",)
 
     def __init__(
         self,
         *,
         env: "SimLogEnvironment",
         topic: EventTopic,
-        single_reference: UUID | None,
+        single_reference: Union[UUID, "ComponentId", None],
         parent: Any | None = None,
         cause: Event | None = None,
     ) -> None:
@@ -121,14 +148,16 @@ class SimLogUuidRefEvent(BaseSimLogEvent):
 class SimLogProcess(Process):
     """Process an event yielding generator with SimLog event attributes."""
 
+    __slots__ = ("topic", "parent", "component_state", "single_reference")
+
     def __init__(
         self,
         env: "SimLogEnvironment",
         generator: ProcessGenerator,
         start_topic: EventTopic,
         end_topic: EventTopic,
-        parent: UUID,
-        target: UUID | None = None,
+        parent: Union[UUID, "ComponentId"],
+        target: Union[UUID, "ComponentId", None] = None,
     ):
         """
         Constructor for the SimLogProcess class.
@@ -145,14 +174,22 @@ class SimLogProcess(Process):
 
         self._target: Event = SimLogInitialize(env, self, start_topic, parent)
         self.topic = end_topic
-        if target is not None:
-            self.single_reference = target
+        self.single_reference = target
+        self.component_state = None
 
 
 class SimLogInitialize(BaseSimLogEvent):
     """Initializes a SimLogProcess process."""
 
-    def __init__(self, env: "SimLogEnvironment", process: "Process", topic: EventTopic, parent: UUID):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        env: "SimLogEnvironment",
+        process: "Process",
+        topic: EventTopic,
+        parent: Union[UUID, "ComponentId"],
+    ):
         """
         Constructor for the SimLogInitialize class.
         """
@@ -0,0 +1,23 @@
+from simlog.engine import BaseComponent, SimLogEnvironment
+from simlog.engine.component_manager import ComponentManager
+
+
+class Component(BaseComponent):
+    def listen(self, event, *args, **kwargs):
+        pass
+
+
+def test_update_state_ignores_equal_state():
+    env = SimLogEnvironment()
+    component = Component(env)
+    env.manager = ComponentManager(env=env, components=[component])
+    literal = "busy"
+    # Built at runtime so that it is equal to, but not the same object as, the literal.
+    busy = "".join(["bu", "sy"])
+    assert busy == literal and busy is not literal
+
+    component.update_state(busy)
+    component.update_state(literal)
+    env.run(until=1)
+
+    assert [entry.topic for entry in env.manager.event_log] == ["STATE_CHANGE"]
@@ -0,0 +1,67 @@
+from simlog.data_models.event_log import Loggable
+from simlog.engine import BaseComponent, SimLogEnvironment
+from simlog.engine.component_manager import ComponentManager
+from simlog.events.events import BaseSimLogEvent, EventTopic, SimLogUuidRefEvent
+
+
+class Recorder(BaseComponent):
+    def __init__(self, env, **kwargs):
+        super().__init__(env, **kwargs)
+        self.heard = []
+
+    def listen(self, event, *args, **kwargs):
+        self.heard.append(event)
+
+
+class LoggableRecorder(Recorder, Loggable):
+    def get_loggable_data(self):
+        return {"name": self.name}
+
+
+class CustomRefEvent(SimLogUuidRefEvent):
+    pass
+
+
+def make_sim():
+    env = SimLogEnvironment()
+    subscriber = Recorder(env, subscriptions=[EventTopic.DUMMY_EVENT])
+    target = Recorder(env)
+    env.manager = ComponentManager(env=env, components=[subscriber, target])
+    return env, subscriber, target
+
+
+def test_topic_event_notifies_subscribers():
+    env, subscriber, target = make_sim()
+
+    event = BaseSimLogEvent(env=env, topic=EventTopic.DUMMY_EVENT).succeed()
+    env.run(until=1)
+
+    assert subscriber.heard == [event]
+    assert target.heard == []
+
+
+def test_event_subclass_dispatches_like_its_base():
+    env, subscriber, target = make_sim()
+
+    event = CustomRefEvent(env=env, topic=EventTopic.DUMMY_EVENT, single_reference=target.uuid).succeed()
+    env.timeout(1)
+    env.run(until=2)
+
+    assert target.heard == [event]
+    assert subscriber.heard == []
+
+
+def test_log_event_resolves_component_ids_to_names():
+    env = SimLogEnvironment()
+    source = Recorder(env, name="source")
+    other = Recorder(env, name="other")
+    loggable = LoggableRecorder(env, name="loggable")
+    env.manager = ComponentManager(env=env, components=[source, other, loggable])
+
+    for value in (other.uuid, other, 5, loggable):
+        BaseSimLogEvent(env=env, topic=EventTopic.DUMMY_EVENT, parent=source.uuid).succeed(value)
+    env.run(until=1)
+
+    logged = [(entry.parent, entry.value) for entry in env.manager.event_log if entry.topic == "DUMMY_EVENT"]
+    # Loggable components are kept, to be serialised via get_loggable_data when the log is dumped.
+    assert logged == [("source", "other"), ("source", "other"), ("source", 5), ("source", loggable)]
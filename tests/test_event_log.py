@@ -0,0 +1,254 @@
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from simlog.data_models import event_log
+from simlog.data_models.event_log import EventLog, EventLogBuffer, Loggable, RawLogEntry
+from simlog.events.events import EventTopic
+
+
+def make_buffer(value) -> EventLogBuffer:
+    buffer = EventLogBuffer()
+    buffer.append(
+        topic="DUMMY_EVENT",
+        parent=None,
+        single_reference=None,
+        sim_time=0,
+        value=value,
+        simpy_id=0,
+        simpy_priority=1,
+        component_state=None,
+    )
+    return buffer
+
+
+def test_json_dump_converts_non_str_keys(tmp_path):
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer({1: "x"})).json_dump(path=path, event_topic=EventTopic)
+
+    assert json.loads(path.read_text())["logs"][0]["value"] == {"1": "x"}
+
+
+def test_json_dump_writes_integers_beyond_64_bits(tmp_path):
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer(2**70)).json_dump(path=path, event_topic=EventTopic)
+
+    assert json.loads(path.read_text())["logs"][0]["value"] == 2**70
+
+
+class Colour(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int
+    y: Colour
+
+
+@dataclass
+class LoggableDataclass(Loggable):
+    x: int
+
+    def get_loggable_data(self):
+        return {"custom": self.x}
+
+
+class Severity(Loggable, Enum):
+    HIGH = 3
+
+    def get_loggable_data(self):
+        return self.name.lower()
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Dump with orjson, and with the standard library fallback used when orjson is unavailable."""
+    if request.param == "json":
+        monkeypatch.setattr(event_log, "orjson", None)
+    return request.param
+
+
+def test_json_dump_serialises_non_native_values(tmp_path, encoder):
+    value = {
+        "enum": Colour.RED,
+        "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+        "datetime": datetime(2020, 1, 1, 12, 30),
+        "date": date(2020, 1, 1),
+        "time": time(1, 2),
+        "dataclass": Point(x=1, y=Colour.RED),
+        "loggable_dataclass": [LoggableDataclass(x=1)],
+        "loggable_enum": Severity.HIGH,
+        "keys": {
+            Colour.RED: 1,
+            UUID("12345678-1234-5678-1234-567812345678"): 2,
+            datetime(2020, 1, 1, 12, 30): 3,
+            date(2020, 1, 1): 4,
+            time(1, 2): 5,
+            7: 6,
+        },
+    }
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer(value)).json_dump(path=path, event_topic=EventTopic)
+
+    assert json.loads(path.read_text())["logs"][0]["value"] == {
+        "enum": "red",
+        "uuid": "12345678-1234-5678-1234-567812345678",
+        "datetime": "2020-01-01T12:30:00",
+        "date": "2020-01-01",
+        "time": "01:02:00",
+        "dataclass": {"x": 1, "y": "red"},
+        "loggable_dataclass": [{"custom": 1}],
+        "loggable_enum": "high",
+        "keys": {
+            "red": 1,
+            "12345678-1234-5678-1234-567812345678": 2,
+            "2020-01-01T12:30:00": 3,
+            "2020-01-01": 4,
+            "01:02:00": 5,
+            "7": 6,
+        },
+    }
+
+
+def test_json_dump_writes_integers_beyond_64_bits_with_enum_keys(tmp_path, encoder):
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer({Colour.RED: 2**70})).json_dump(path=path, event_topic=EventTopic)
+
+    assert json.loads(path.read_text())["logs"][0]["value"] == {"red": 2**70}
+
+
+def test_json_dump_accepts_str_path(tmp_path, encoder):
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer("x")).json_dump(path=str(path), event_topic=EventTopic)
+
+    assert json.loads(path.read_text())["logs"][0]["value"] == "x"
+
+
+class CountingLoggable(Loggable):
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    def get_loggable_data(self):
+        self.calls += 1
+        return self.data
+
+
+def test_json_dump_does_not_retry_unserialisable_values(tmp_path, encoder):
+    loggable = CountingLoggable({"x": object()})
+    path = tmp_path / "event_log.json"
+
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        EventLog(logs=make_buffer({"nested": loggable})).json_dump(path=path, event_topic=EventTopic)
+
+    assert loggable.calls == 1
+    assert not path.exists()
+
+
+def test_json_dump_accepts_topic_members(tmp_path):
+    path = tmp_path / "event_log.json"
+
+    EventLog(logs=make_buffer(None)).json_dump(path=path, event_topic=[EventTopic.DUMMY_EVENT])
+
+    assert json.loads(path.read_text())["event_descriptions"] == {"DUMMY_EVENT": "Example event"}
+
+
+def test_buffer_indexing():
+    buffer = make_buffer("first")
+    buffer.append(
+        topic="STATE_CHANGE",
+        parent="a",
+        single_reference="b",
+        sim_time=1.5,
+        value="last",
+        simpy_id=1,
+        simpy_priority=0,
+        component_state="busy",
+    )
+
+    assert buffer[-1] == RawLogEntry(
+        topic="STATE_CHANGE",
+        parent="a",
+        single_reference="b",
+        sim_time=1.5,
+        value="last",
+        simpy_id=1,
+        simpy_priority=0,
+        component_state="busy",
+    )
+    assert buffer[:1] == [buffer[0]]
+    assert list(buffer) == [buffer[0], buffer[1]]
+
+
+def test_buffer_dumps_like_logged_events(tmp_path):
+    buffer = make_buffer({"a": 1})
+    buffer.append(
+        topic="STATE_CHANGE",
+        parent="a",
+        single_reference=None,
+        sim_time=2,
+        value=None,
+        simpy_id=1,
+        simpy_priority=0,
+        component_state="busy",
+    )
+    buffer_path = tmp_path / "buffer.json"
+    list_path = tmp_path / "list.json"
+
+    EventLog(logs=buffer).json_dump(path=buffer_path, event_topic=EventTopic)
+    EventLog(logs=[entry.to_logged_event() for entry in buffer]).json_dump(path=list_path, event_topic=EventTopic)
+
+    assert buffer_path.read_bytes() == list_path.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "field, invalid",
+    [("sim_time", "later"), ("simpy_id", 2**70), ("simpy_priority", 2**70)],
+)
+def test_buffer_rejected_row_leaves_columns_aligned(field, invalid):
+    buffer = make_buffer("first")
+    row = dict(
+        topic="STATE_CHANGE",
+        parent=None,
+        single_reference=None,
+        sim_time=1,
+        value="rejected",
+        simpy_id=1,
+        simpy_priority=0,
+        component_state=None,
+    )
+    row[field] = invalid
+
+    with pytest.raises((OverflowError, TypeError)):
+        buffer.append(**row)
+
+    assert {len(getattr(buffer, column)) for column in EventLogBuffer.__slots__} == {1}
+    assert list(buffer) == [buffer[0]]
+    assert buffer[0].value == "first"
+
+
+def test_event_log_model_dump_serialises_buffer():
+    buffer = make_buffer({"a": 1})
+
+    assert json.loads(EventLog(logs=buffer).model_dump_json())["logs"] == [
+        {
+            "topic": "DUMMY_EVENT",
+            "parent": None,
+            "single_reference": None,
+            "sim_time": 0.0,
+            "value": {"a": 1},
+            "simpy_id": 0,
+            "simpy_priority": 1,
+            "component_state": None,
+        }
+    ]
+    assert EventLog(logs=buffer).model_dump() == EventLog(logs=[buffer[0].to_logged_event()]).model_dump()